@@ -210,9 +210,15 @@ class RegexBasedDetector(BasePlugin):
         denylist = (
             re.compile(r'foo'),
         )
+
+    If every secret in the denylist contains one of a few fixed strings,
+    list them in `required_substrings`, so that files without any of them
+    can be skipped without running the regexes at all.
     """
     __metaclass__ = ABCMeta
 
+    required_substrings = ()
+
     @abstractproperty
     def secret_type(self):
         raise NotImplementedError
@@ -221,6 +227,39 @@ class RegexBasedDetector(BasePlugin):
     def denylist(self):
         raise NotImplementedError
 
+    def __init__(self, *args, **kwargs):
+        super(RegexBasedDetector, self).__init__(*args, **kwargs)
+
+        # These are only used to check whether a file is worth analyzing
+        # line by line, so they need to match at any line boundary.
+        self._file_denylist = tuple(
+            re.compile(regex.pattern, regex.flags | re.MULTILINE)
+            for regex in self.denylist
+        )
+
+    def analyze(self, file, filename):
+        # Most files don't contain anything in the denylist, so rather than
+        # running every line through the allowlist and denylist regexes,
+        # we scan the whole file once and bail early if nothing shows up.
+        content = file.read()
+        if (
+            self.required_substrings and
+            not any(
+                substring in content
+                for substring in self.required_substrings
+            )
+        ):
+            return {}
+
+        if not any(
+            regex.search(content)
+            for regex in self._file_denylist
+        ):
+            return {}
+
+        file.seek(0)
+        return super(RegexBasedDetector, self).analyze(file, filename)
+
     def analyze_string_content(self, string, line_num, filename):
         output = {}
 
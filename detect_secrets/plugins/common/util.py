@@ -1,29 +1,25 @@
+import math
+from collections import Counter
+
 try:
     from functools import lru_cache
 except ImportError:  # pragma: no cover
     from functools32 import lru_cache
 
-# These plugins need to be imported here so that globals()
-# can find them.
-from ..artifactory import ArtifactoryDetector               # noqa: F401
-from ..aws import AWSKeyDetector                            # noqa: F401
-from ..base import BasePlugin
-from ..basic_auth import BasicAuthDetector                  # noqa: F401
-from ..high_entropy_strings import Base64HighEntropyString  # noqa: F401
-from ..high_entropy_strings import HexHighEntropyString     # noqa: F401
-from ..jwt import JwtTokenDetector                          # noqa: F401
-from ..keyword import KeywordDetector                       # noqa: F401
-from ..mailchimp import MailchimpDetector                   # noqa: F401
-from ..private_key import PrivateKeyDetector                # noqa: F401
-from ..slack import SlackDetector                           # noqa: F401
-from ..stripe import StripeDetector                         # noqa: F401
+import requests
+from requests.adapters import HTTPAdapter
 
 
 @lru_cache(maxsize=1)
 def get_mapping_from_secret_type_to_class_name():
     """Returns secret_type => plugin classname"""
+    # Plugins use the other helpers in this module, so we can't import
+    # them at the top of the file. `initialize` already has them all.
+    from . import initialize
+    from ..base import BasePlugin
+
     mapping = {}
-    for key, value in globals().items():
+    for key, value in vars(initialize).items():
         try:
             if issubclass(value, BasePlugin) and value != BasePlugin:
                 mapping[value.secret_type] = key
@@ -31,3 +27,43 @@ def get_mapping_from_secret_type_to_class_name():
             pass
 
     return mapping
+
+
+def calculate_shannon_entropy(data):
+    """Returns the entropy of a given string.
+
+    Borrowed from: http://blog.dkbza.org/2007/05/scanning-data-for-entropy-anomalies.html.
+
+    :param data:  string. The word to analyze.
+    :returns:       float, between 0.0 and 8.0
+    """
+    if not data:  # pragma: no cover
+        return 0
+
+    length = float(len(data))
+    return -sum(
+        count / length * math.log(count / length, 2)
+        for count in Counter(data).values()
+    )
+
+
+@lru_cache(maxsize=1)
+def get_session():
+    """
+    Plugins verify secrets through this shared session, so that connections
+    are kept alive across verifications, rather than doing a new TLS
+    handshake for every token we check.
+
+    NOTE: This session is deliberately shared across threads (e.g. when
+          AWSKeyDetector verifies candidates concurrently). None of our
+          verifiers rely on cookies, and the connection pool is thread-safe.
+
+    :rtype: requests.Session
+    """
+    session = requests.Session()
+    session.mount(
+        'https://',
+        HTTPAdapter(pool_connections=4, pool_maxsize=16),
+    )
+
+    return session
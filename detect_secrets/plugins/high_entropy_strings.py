@@ -19,6 +19,7 @@ from .common.filetype import determine_file_type
 from .common.filetype import FileType
 from .common.filters import is_false_positive
 from .common.ini_file_parser import IniFileParser
+from .common.util import calculate_shannon_entropy
 from .common.yaml_file_parser import YamlFileParser
 from detect_secrets.core.potential_secret import PotentialSecret
 
@@ -66,23 +67,12 @@ class HighEntropyStringsPlugin(BasePlugin):
         return {}
 
     def calculate_shannon_entropy(self, data):
-        """Returns the entropy of a given string.
-
-        Borrowed from: http://blog.dkbza.org/2007/05/scanning-data-for-entropy-anomalies.html.
+        """Broken out, so that subclasses can adjust the entropy for their charset.
 
         :param data:  string. The word to analyze.
         :returns:       float, between 0.0 and 8.0
         """
-        if not data:  # pragma: no cover
-            return 0
-
-        entropy = 0
-        for x in self.charset:
-            p_x = float(data.count(x)) / len(data)
-            if p_x > 0:
-                entropy += - p_x * math.log(p_x, 2)
-
-        return entropy
+        return calculate_shannon_entropy(data)
 
     def analyze_string_content(self, string, line_num, filename):
         """Searches string for custom pattern, and captures all high entropy strings that
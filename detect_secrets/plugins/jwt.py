@@ -20,9 +20,18 @@ except ImportError:  # pragma: no cover
 class JwtTokenDetector(RegexBasedDetector):
     secret_type = 'JSON Web Token'
     denylist = [
-        re.compile(r'eyJ[A-Za-z0-9-_=]+\.[A-Za-z0-9-_=]+\.?[A-Za-z0-9-_.+/=]*?'),
+        # The header and payload are both base64 encoded JSON objects, so they
+        # start with `eyJ` (`{"`). Both also need at least ten more characters,
+        # since the header always has an `alg` field, and trivially short
+        # payloads (e.g. `{"a":1}`) are far more likely to be false positives.
+        #
+        # NOTE: The signature is deliberately left out of the match, so that
+        #       the secret (and its hash in existing baselines) stays the same.
+        re.compile(r'eyJ[A-Za-z0-9_=-]{10,}\.eyJ[A-Za-z0-9_=-]{10,}\.?'),
     ]
 
+    required_substrings = ('eyJ',)
+
     def secret_generator(self, string, *args, **kwargs):
         return filter(
             self.is_formally_valid,
@@ -32,20 +41,29 @@ class JwtTokenDetector(RegexBasedDetector):
     @staticmethod
     def is_formally_valid(token):
         parts = token.split('.')
+        if len(parts) < 2:
+            # We need at least a header and a payload.
+            return False
+
         for idx, part in enumerate(parts):
             try:
                 part = part.encode('ascii')
                 # https://github.com/magical/jwt-python/blob/2fd976b41111031313107792b40d5cfd1a8baf90/jwt.py#L49
                 # https://github.com/jpadilla/pyjwt/blob/3d47b0ea9e5d489f9c90ee6dde9e3d9d69244e3a/jwt/utils.py#L33
-                m = len(part) % 4
-                if m == 1:
-                    raise TypeError('Incorrect padding')
-                elif m == 2:
-                    part += '=='.encode('utf-8')
-                elif m == 3:
-                    part += '==='.encode('utf-8')
+                padding = -len(part) % 4
+                if padding == 3:
+                    # Incorrect padding
+                    return False
+
+                part += b'=' * padding
                 b64_decoded = base64.urlsafe_b64decode(part)
                 if idx < 2:
+                    # The header and payload are always JSON objects, so we can
+                    # rule out most false positives before invoking the parser.
+                    stripped = b64_decoded.strip()
+                    if not (stripped[:1] == b'{' and stripped[-1:] == b'}'):
+                        return False
+
                     _ = json.loads(b64_decoded.decode('utf-8'))
             except (TypeError, ValueError, UnicodeDecodeError):
                 return False
@@ -6,9 +6,13 @@ from __future__ import absolute_import
 import re
 from base64 import b64encode
 
-import requests
+try:
+    from functools import lru_cache
+except ImportError:  # pragma: no cover
+    from functools32 import lru_cache
 
 from .base import RegexBasedDetector
+from .common.util import get_session
 from detect_secrets.core.constants import VerifiedResult
 
 
@@ -20,21 +24,33 @@ class MailchimpDetector(RegexBasedDetector):
         re.compile(r'[0-9a-z]{32}-us[0-9]{1,2}'),
     )
 
-    def verify(self, token, **kwargs):  # pragma: no cover
-        _, datacenter_number = token.split('-us')
+    required_substrings = ('-us',)
 
-        response = requests.get(
-            'https://us{}.api.mailchimp.com/3.0/'.format(
-                datacenter_number,
+    def verify(self, token, **kwargs):  # pragma: no cover
+        return verify_mailchimp_key(token)
+
+
+# The same secret often shows up in many files, so only check it once.
+@lru_cache(maxsize=4096)
+def verify_mailchimp_key(token):  # pragma: no cover
+    """
+    :type token: str
+    :rtype: VerifiedResult
+    """
+    _, datacenter_number = token.split('-us')
+
+    response = get_session().get(
+        'https://us{}.api.mailchimp.com/3.0/'.format(
+            datacenter_number,
+        ),
+        headers={
+            'Authorization': b'Basic ' + b64encode(
+                'any_user:{}'.format(token).encode('utf-8'),
             ),
-            headers={
-                'Authorization': b'Basic ' + b64encode(
-                    'any_user:{}'.format(token).encode('utf-8'),
-                ),
-            },
-        )
-        return (
-            VerifiedResult.VERIFIED_TRUE
-            if response.status_code == 200
-            else VerifiedResult.VERIFIED_FALSE
-        )
+        },
+    )
+    return (
+        VerifiedResult.VERIFIED_TRUE
+        if response.status_code == 200
+        else VerifiedResult.VERIFIED_FALSE
+    )
@@ -28,6 +28,7 @@ setup(
             'enum34',
             'future',
             'functools32',
+            'futures',
         ],
         'word_list': [
             'pyahocorasick',
@@ -1,6 +1,7 @@
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
+import re
 from contextlib import contextmanager
 
 import mock
@@ -8,6 +9,7 @@ import pytest
 
 from detect_secrets.core.constants import VerifiedResult
 from detect_secrets.plugins.base import BasePlugin
+from detect_secrets.plugins.base import RegexBasedDetector
 from testing.factories import potential_secret_factory
 from testing.mocks import mock_file_object
 
@@ -116,3 +118,56 @@ class TestVerify:
             mock_snippet().get_code_snippet.return_value = ''
 
             yield plugin
+
+
+class TestRegexBasedDetector(object):
+
+    class MockPlugin(RegexBasedDetector):
+        secret_type = 'test_regex'
+
+        denylist = (
+            re.compile(r'^foo[0-9]+$'),
+        )
+
+    @pytest.mark.parametrize(
+        'file_content, expected_secrets',
+        (
+            (
+                'bar\nfoo123\nbaz',
+                {'foo123'},
+            ),
+            (
+                'bar = foo123',
+                set(),
+            ),
+        ),
+    )
+    def test_analyze(self, file_content, expected_secrets):
+        output = self.MockPlugin().analyze(
+            mock_file_object(file_content),
+            'mock_filename',
+        )
+
+        assert {secret.secret_value for secret in output} == expected_secrets
+
+    def test_analyze_skips_lines_without_file_level_match(self):
+        plugin = self.MockPlugin()
+        with mock.patch.object(plugin, 'analyze_string') as mock_analyze_string:
+            assert plugin.analyze(
+                mock_file_object('bar\nbaz'),
+                'mock_filename',
+            ) == {}
+
+        assert not mock_analyze_string.called
+
+    def test_analyze_skips_regexes_without_required_substrings(self):
+        plugin = self.MockPlugin()
+        plugin.required_substrings = ('foo',)
+        plugin._file_denylist = (mock.Mock(),)
+
+        assert plugin.analyze(
+            mock_file_object('bar\nbaz'),
+            'mock_filename',
+        ) == {}
+
+        assert not plugin._file_denylist[0].search.called
@@ -0,0 +1,33 @@
+from __future__ import absolute_import
+
+import pytest
+
+from detect_secrets.plugins.common.util import calculate_shannon_entropy
+from detect_secrets.plugins.common.util import get_mapping_from_secret_type_to_class_name
+from detect_secrets.plugins.common.util import get_session
+
+
+def test_get_mapping_from_secret_type_to_class_name():
+    mapping = get_mapping_from_secret_type_to_class_name()
+
+    assert mapping['AWS Access Key'] == 'AWSKeyDetector'
+    assert 'BasePlugin' not in mapping.values()
+
+
+def test_get_session_is_shared():
+    session = get_session()
+
+    assert get_session() is session
+    assert session.get_adapter('https://api.stripe.com')._pool_maxsize == 16
+
+
+@pytest.mark.parametrize(
+    'data, expected_entropy',
+    (
+        ('aaaa', 0),
+        ('ab', 1),
+        ('0123456789abcdef', 4),
+    ),
+)
+def test_calculate_shannon_entropy(data, expected_entropy):
+    assert calculate_shannon_entropy(data) == pytest.approx(expected_entropy)